@@ -2,15 +2,50 @@
 
 import asyncio
 import json
+import os
+import random
+import re
 from typing import Optional, Any
 from dataclasses import dataclass
 
 import httpx
+import orjson
 
 from config import config
+from bot.batch import AnthropicBatchProcessor
+from bot.cache import DiskCache, LLMResponseCache, llm_cache_key
 from bot.prompts import AGENT_PROMPTS, FORECAST_TEMPLATE, PEER_REVIEW_TEMPLATE
+from bot.rate_limit import TokenBucket
 from bot.utils import parse_probability, extract_reasoning
-from models.schemas import AgentForecast, ResearchContext
+from models.schemas import AgentForecast
+
+# Generation caps per call type; latency scales with emitted tokens, and a
+# peer review is bounded by its prompt at ~200 words.
+FORECAST_MAX_TOKENS = 1500
+PEER_REVIEW_MAX_TOKENS = 400
+
+# A PROBABILITY line whose number has been followed by whitespace is complete
+_PROBABILITY_DONE = re.compile(r"PROBABILITY:\s*[\d.]+\s", re.IGNORECASE)
+
+# Process-wide caps on outbound LLM proxy traffic, shared by all agents.
+# asyncio primitives bind to the loop that first contends them, so they are
+# built lazily and rebuilt whenever a new event loop is running.
+_llm_limits: Optional[
+    tuple[asyncio.AbstractEventLoop, asyncio.Semaphore, TokenBucket]
+] = None
+
+
+def _limits() -> tuple[asyncio.Semaphore, TokenBucket]:
+    """Get the LLM concurrency and rate limits for the running event loop."""
+    global _llm_limits
+    loop = asyncio.get_running_loop()
+    if _llm_limits is None or _llm_limits[0] is not loop:
+        _llm_limits = (
+            loop,
+            asyncio.Semaphore(config.max_concurrent_llm_calls),
+            TokenBucket(config.llm_rpm),
+        )
+    return _llm_limits[1], _llm_limits[2]
 
 
 @dataclass
@@ -52,6 +87,16 @@ AGENT_CONFIGS = {
 class LLMAgent:
     """Agent that makes forecasts via Metaculus LLM proxy."""
 
+    # Shared across all agents so calls reuse pooled keep-alive connections;
+    # pooled connections belong to the event loop that opened them.
+    _client: Optional[httpx.AsyncClient] = None
+    _client_loop: Optional[asyncio.AbstractEventLoop] = None
+    _response_cache = LLMResponseCache(
+        max_size=config.cache_max_size,
+        disk=DiskCache(os.path.join(config.cache_dir, "llm_responses.sqlite3")),
+        disk_ttl_seconds=config.llm_cache_ttl_seconds,
+    )
+
     def __init__(self, agent_config: AgentConfig):
         self.name = agent_config.name
         self.system_prompt = agent_config.system_prompt
@@ -63,11 +108,9 @@ class LLMAgent:
         self,
         question_text: str,
         resolution_criteria: str,
-        research_context: ResearchContext,
+        research_section: str,
         model: str = "claude-sonnet-4-20250514",
     ) -> AgentForecast:
-        research_section = research_context.to_prompt_section()
-
         user_message = FORECAST_TEMPLATE.format(
             question_text=question_text,
             resolution_criteria=resolution_criteria,
@@ -77,8 +120,14 @@ class LLMAgent:
         response = await self._call_llm(
             messages=[{"role": "user", "content": user_message}],
             model=model,
+            max_tokens=FORECAST_MAX_TOKENS,
+            stop_at_probability=True,
         )
 
+        return self.forecast_from_response(response)
+
+    def forecast_from_response(self, response: str) -> AgentForecast:
+        """Parse an initial forecast out of a raw LLM response."""
         probability = parse_probability(response) or 0.5
         reasoning = extract_reasoning(response)
 
@@ -116,6 +165,7 @@ Keep your critique constructive and under 200 words."""
         response = await self._call_llm(
             messages=[{"role": "user", "content": user_message}],
             model=model,
+            max_tokens=PEER_REVIEW_MAX_TOKENS,
         )
 
         return response
@@ -137,6 +187,8 @@ Keep your critique constructive and under 200 words."""
         response = await self._call_llm(
             messages=[{"role": "user", "content": user_message}],
             model=model,
+            max_tokens=FORECAST_MAX_TOKENS,
+            stop_at_probability=True,
         )
 
         probability = (
@@ -159,39 +211,137 @@ Keep your critique constructive and under 200 words."""
         messages: list[dict],
         model: str,
         max_tokens: int = 2000,
+        use_cache: bool = True,
+        stop_at_probability: bool = False,
     ) -> str:
+        cache_key = llm_cache_key(model, self.system_prompt, messages, max_tokens)
+
+        if use_cache:
+            cached = await self._response_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
         payload = {
             "model": model,
             "max_tokens": max_tokens,
             "system": self.system_prompt,
             "messages": messages,
         }
+        if stop_at_probability:
+            payload["stream"] = True
 
         headers = {
             "Content-Type": "application/json",
             "x-api-key": config.metaculus_token,
         }
 
+        body = orjson.dumps(payload)
+        client = await self._get_client()
+        semaphore, rate_limit = _limits()
+
         for attempt in range(config.agent_max_retries):
             try:
-                async with httpx.AsyncClient(timeout=self.timeout) as client:
-                    response = await client.post(
-                        self.proxy_url,
-                        headers=headers,
-                        json=payload,
-                    )
-                    response.raise_for_status()
-                    data = response.json()
-                    return data["content"][0]["text"]
+                async with semaphore:
+                    await rate_limit.acquire()
+                    if stop_at_probability:
+                        text = await self._stream_until_probability(
+                            client, headers, body
+                        )
+                    else:
+                        response = await client.post(
+                            self.proxy_url,
+                            headers=headers,
+                            content=body,
+                        )
+                        response.raise_for_status()
+                        data = orjson.loads(response.content)
+                        text = data["content"][0]["text"]
+                # Never cache an empty reply; it would pin every retry to 0.5
+                if use_cache and text:
+                    await self._response_cache.set(cache_key, text)
+                return text
             except Exception as e:
                 if attempt == config.agent_max_retries - 1:
                     raise RuntimeError(
                         f"LLM call failed after {config.agent_max_retries} attempts: {e}"
                     )
-                await asyncio.sleep(2**attempt)
+                await asyncio.sleep(self._retry_delay(e, attempt))
 
         return ""
 
+    async def _stream_until_probability(
+        self, client: httpx.AsyncClient, headers: dict, body: bytes
+    ) -> str:
+        """Stream a response, returning as soon as its PROBABILITY is complete.
+
+        The reasoning precedes the PROBABILITY line in our response formats,
+        so anything generated after it is never used.
+        """
+        text = ""
+        async with client.stream(
+            "POST", self.proxy_url, headers=headers, content=body
+        ) as response:
+            response.raise_for_status()
+            content_type = response.headers.get("content-type", "")
+            if not content_type.startswith("text/event-stream"):
+                # The proxy ignored stream=True and sent the whole message
+                data = orjson.loads(await response.aread())
+                return data["content"][0]["text"]
+            async for line in response.aiter_lines():
+                if not line.startswith("data:"):
+                    continue
+                event = orjson.loads(line[5:])
+                if event.get("type") == "error":
+                    raise RuntimeError(f"LLM stream error: {event.get('error')}")
+                if event.get("type") != "content_block_delta":
+                    continue
+                text += event["delta"].get("text", "")
+                # The label can straddle deltas, so search a short tail
+                if _PROBABILITY_DONE.search(text, max(0, len(text) - 64)):
+                    break
+        if not text:
+            raise RuntimeError("LLM stream ended without any text")
+        return text
+
+    @staticmethod
+    def _retry_delay(error: Exception, attempt: int) -> float:
+        """Jittered exponential backoff, stretched to honor Retry-After."""
+        delay = (2**attempt) * (0.5 + random.random())
+        if isinstance(error, httpx.HTTPStatusError) and (
+            error.response.status_code in (429, 503)
+        ):
+            retry_after = error.response.headers.get("retry-after")
+            try:
+                delay = max(delay, float(retry_after))
+            except (TypeError, ValueError):
+                pass
+        return delay
+
+    async def _get_client(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        if (
+            LLMAgent._client is None
+            or LLMAgent._client.is_closed
+            or LLMAgent._client_loop is not loop
+        ):
+            LLMAgent._client_loop = loop
+            LLMAgent._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=httpx.Limits(
+                    max_keepalive_connections=32,
+                    max_connections=64,
+                ),
+            )
+        return LLMAgent._client
+
+    @classmethod
+    async def aclose(cls) -> None:
+        """Close the shared HTTP client. Call once at shutdown."""
+        if cls._client is not None:
+            await cls._client.aclose()
+            cls._client = None
+            cls._client_loop = None
+
 
 def create_committee(
     agent_names: Optional[list[str]] = None,
@@ -211,11 +361,28 @@ async def run_initial_forecasts(
     agents: list[LLMAgent],
     question_text: str,
     resolution_criteria: str,
-    research_context: ResearchContext,
+    research_section: str,
     model: str = "claude-sonnet-4-20250514",
+    batch_processor: Optional[AnthropicBatchProcessor] = None,
 ) -> list[AgentForecast]:
+    if batch_processor is not None:
+        user_message = FORECAST_TEMPLATE.format(
+            question_text=question_text,
+            resolution_criteria=resolution_criteria,
+            research_section=research_section,
+        )
+        messages = [{"role": "user", "content": user_message}]
+        responses = await batch_processor.process(
+            [(agent, messages, model) for agent in agents],
+            max_tokens=FORECAST_MAX_TOKENS,
+        )
+        return [
+            agent.forecast_from_response(response)
+            for agent, response in zip(agents, responses)
+        ]
+
     tasks = [
-        agent.forecast(question_text, resolution_criteria, research_context, model)
+        agent.forecast(question_text, resolution_criteria, research_section, model)
         for agent in agents
     ]
 
@@ -229,16 +396,12 @@ async def run_peer_reviews(
     model: str = "claude-sonnet-4-20250514",
 ) -> list[str]:
     n = len(agents)
-    critiques = []
-
-    for i, agent in enumerate(agents):
-        reviewed_idx = (i + 1) % n
-        critique = await agent.peer_review(
-            question_text, forecasts[reviewed_idx], model
-        )
-        critiques.append(critique)
+    tasks = [
+        agent.peer_review(question_text, forecasts[(i + 1) % n], model)
+        for i, agent in enumerate(agents)
+    ]
 
-    return critiques
+    return await asyncio.gather(*tasks)
 
 
 async def run_revisions(
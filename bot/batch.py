@@ -0,0 +1,121 @@
+"""Anthropic Message Batches support for committee LLM calls.
+
+Batches trade latency for cost: requests are processed asynchronously by
+Anthropic (usually within minutes) at half the per-token price. Use them for
+bulk tournament runs, not for interactive single-question forecasts.
+"""
+
+import asyncio
+import json
+import logging
+from typing import Optional, TYPE_CHECKING
+
+import httpx
+
+from config import config
+
+if TYPE_CHECKING:
+    from bot.agents import LLMAgent
+
+logger = logging.getLogger(__name__)
+
+
+class AnthropicBatchProcessor:
+    """Submits independent LLM requests as one Anthropic message batch."""
+
+    BASE_URL = "https://api.anthropic.com/v1/messages/batches"
+    API_VERSION = "2023-06-01"
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        poll_interval: float = 10.0,
+        max_wait: float = 3600.0,
+        timeout: int = 60,
+    ):
+        self.api_key = api_key or config.anthropic_api_key
+        self.poll_interval = poll_interval
+        self.max_wait = max_wait
+        self.timeout = timeout
+
+    async def process(
+        self,
+        requests: list[tuple["LLMAgent", list[dict], str]],
+        max_tokens: int = 2000,
+    ) -> list[str]:
+        """Run (agent, messages, model) requests as a batch.
+
+        Returns:
+            Response texts in the same order as ``requests``
+        """
+        batch_requests = [
+            {
+                "custom_id": f"req_{i}_{agent.name}",
+                "params": {
+                    "model": model,
+                    "max_tokens": max_tokens,
+                    "system": agent.system_prompt,
+                    "messages": messages,
+                },
+            }
+            for i, (agent, messages, model) in enumerate(requests)
+        ]
+
+        headers = {
+            "x-api-key": self.api_key,
+            "anthropic-version": self.API_VERSION,
+            "content-type": "application/json",
+        }
+
+        async with httpx.AsyncClient(timeout=self.timeout, headers=headers) as client:
+            response = await client.post(
+                self.BASE_URL, json={"requests": batch_requests}
+            )
+            response.raise_for_status()
+            batch = response.json()
+            logger.info(
+                f"Submitted batch {batch['id']} ({len(batch_requests)} requests)"
+            )
+
+            batch = await self._wait_for_batch(client, batch)
+            results = await self._fetch_results(client, batch["results_url"])
+
+        texts = []
+        for request in batch_requests:
+            custom_id = request["custom_id"]
+            result = results.get(custom_id)
+            if not result or result.get("type") != "succeeded":
+                raise RuntimeError(f"Batch request {custom_id} failed: {result}")
+            texts.append(result["message"]["content"][0]["text"])
+
+        return texts
+
+    async def _wait_for_batch(self, client: httpx.AsyncClient, batch: dict) -> dict:
+        waited = 0.0
+        while batch["processing_status"] != "ended":
+            if waited >= self.max_wait:
+                raise RuntimeError(
+                    f"Batch {batch['id']} not finished after {self.max_wait:.0f}s"
+                )
+            await asyncio.sleep(self.poll_interval)
+            waited += self.poll_interval
+
+            response = await client.get(f"{self.BASE_URL}/{batch['id']}")
+            response.raise_for_status()
+            batch = response.json()
+
+        return batch
+
+    async def _fetch_results(
+        self, client: httpx.AsyncClient, results_url: str
+    ) -> dict[str, dict]:
+        """Download the JSONL results file, indexed by custom_id."""
+        response = await client.get(results_url)
+        response.raise_for_status()
+
+        results = {}
+        for line in response.text.splitlines():
+            if line.strip():
+                entry = json.loads(line)
+                results[entry["custom_id"]] = entry["result"]
+        return results
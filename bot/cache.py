@@ -0,0 +1,134 @@
+"""Response caches for LLM proxy calls.
+
+Two tiers: a bounded in-memory LRU for the current process, backed by an
+SQLite file under ``config.cache_dir`` so reruns and resumed jobs can reuse
+responses across processes.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+def llm_cache_key(
+    model: str,
+    system_prompt: str,
+    messages: list[dict],
+    max_tokens: int,
+) -> str:
+    """Fingerprint everything that determines an LLM response."""
+    raw = json.dumps(
+        {"m": model, "s": system_prompt, "u": messages, "t": max_tokens},
+        sort_keys=True,
+    )
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+class DiskCache:
+    """SQLite-backed string store with per-entry expiry.
+
+    The database is opened lazily on first use. Methods are blocking; call
+    them via ``asyncio.to_thread`` from async code.
+    """
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(
+                self.path, check_same_thread=False, isolation_level=None
+            )
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries "
+                "(key TEXT PRIMARY KEY, expires_at REAL NOT NULL, value TEXT NOT NULL)"
+            )
+        return self._conn
+
+    def get(self, key: str) -> Optional[str]:
+        """Get a stored value if present and not expired."""
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute(
+                "SELECT value, expires_at FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if row[1] < time.time():
+                conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                return None
+            return row[0]
+
+    def set(self, key: str, value: str, ttl_seconds: int) -> None:
+        """Store a value that expires after ``ttl_seconds``."""
+        with self._lock:
+            self._connect().execute(
+                "INSERT OR REPLACE INTO entries (key, expires_at, value) "
+                "VALUES (?, ?, ?)",
+                (key, time.time() + ttl_seconds, value),
+            )
+
+
+class LLMResponseCache:
+    """Bounded in-memory LRU cache of LLM responses, optionally backed by disk.
+
+    Only exact prompt matches are served: a near-miss prompt can carry
+    different research, and reusing its forecast would be silently wrong.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1000,
+        disk: Optional[DiskCache] = None,
+        disk_ttl_seconds: int = 86400,
+    ):
+        self.cache: OrderedDict[str, str] = OrderedDict()
+        self.max_size = max_size
+        self.disk = disk
+        self.disk_ttl = disk_ttl_seconds
+
+    async def get(self, key: str) -> Optional[str]:
+        """Get cached response text, checking memory before disk."""
+        text = self.cache.get(key)
+        if text is not None:
+            self.cache.move_to_end(key)
+            logger.debug("LLM cache HIT for %s", key[:12])
+            return text
+
+        if self.disk is not None:
+            text = await asyncio.to_thread(self.disk.get, key)
+            if text is not None:
+                logger.debug("LLM disk cache HIT for %s", key[:12])
+                self._remember(key, text)
+                return text
+
+        return None
+
+    async def set(self, key: str, text: str) -> None:
+        """Cache response text in memory and, if configured, on disk."""
+        self._remember(key, text)
+        if self.disk is not None:
+            await asyncio.to_thread(self.disk.set, key, text, self.disk_ttl)
+
+    def _remember(self, key: str, text: str) -> None:
+        self.cache[key] = text
+        self.cache.move_to_end(key)
+        while len(self.cache) > self.max_size:
+            self.cache.popitem(last=False)
+
+    def clear(self) -> None:
+        """Clear the in-memory tier."""
+        self.cache.clear()
@@ -3,13 +3,18 @@
 import asyncio
 from typing import Optional
 
+import numpy as np
+
 from bot.agents import (
+    FORECAST_MAX_TOKENS,
     create_committee,
     run_initial_forecasts,
     run_peer_reviews,
     run_revisions,
     LLMAgent,
 )
+from bot.batch import AnthropicBatchProcessor
+from bot.rate_limit import LeakyBucketLimiter
 from bot.utils import weighted_average, aggregate_logit_space
 from bot.prompts import SYNTHESIS_TEMPLATE, format_agent_forecasts
 from models.schemas import AgentForecast, CommitteeResult, ResearchContext
@@ -24,10 +29,25 @@ class Forecaster:
         agent_names: Optional[list[str]] = None,
         model: str = "claude-sonnet-4-20250514",
         use_peer_review: bool = True,
+        batch_mode: Optional[str] = None,
+        rate_limiter: Optional[LeakyBucketLimiter] = None,
     ):
         self.agents = create_committee(agent_names)
         self.model = model
         self.use_peer_review = use_peer_review
+        self.rate_limiter = rate_limiter
+
+        if batch_mode is None:
+            self._batch_processor = None
+        elif batch_mode == "anthropic":
+            self._batch_processor = AnthropicBatchProcessor()
+        else:
+            raise ValueError(f"Unknown batch mode: {batch_mode}")
+
+        # Committee is fixed for the forecaster's lifetime; forecasts come
+        # back in agent order, so weights can be computed once here.
+        self._weights = np.array([a.weight for a in self.agents], dtype=np.float64)
+        self._norm_weights = self._weights / (self._weights.sum() or 1.0)
 
     async def forecast_binary(
         self,
@@ -42,19 +62,22 @@ class Forecaster:
             question_text,
             include_asknews=use_asknews,
             include_perplexity=use_perplexity,
+            rate_limiter=self.rate_limiter,
         )
 
         research = ResearchContext(
             question_text=question_text,
             adj_prior_section=research_str,
         )
+        research_section = research.to_prompt_section()
 
         forecasts = await run_initial_forecasts(
             self.agents,
             question_text,
             resolution_criteria,
-            research,
+            research_section,
             self.model,
+            batch_processor=self._batch_processor,
         )
 
         if self.use_peer_review:
@@ -72,7 +95,7 @@ class Forecaster:
             question_id=question_id,
             question_text=question_text,
             question_type="binary",
-            research_context=research.to_prompt_section(),
+            research_context=research_section,
             agent_forecasts=forecasts,
             final_probability=final_prob,
             reasoning_summary=reasoning,
@@ -95,41 +118,47 @@ class Forecaster:
             question_text,
             include_asknews=use_asknews,
             include_perplexity=use_perplexity,
+            rate_limiter=self.rate_limiter,
         )
         research = ResearchContext(
             question_text=question_text,
             adj_prior_section=research_str,
         )
+        research_section = research.to_prompt_section()
 
         from bot.prompts import NUMERIC_FORECAST_TEMPLATE
 
-        forecasts = []
-        for agent in self.agents:
-            forecast = await self._forecast_numeric_agent(
-                agent,
-                question_text,
-                resolution_criteria,
-                research,
-                lower_bound,
-                upper_bound,
-                open_lower,
-                open_upper,
-            )
-            forecasts.append(forecast)
+        # The user turn is identical for every agent; only the system
+        # prompt differs, so render it once.
+        user_message = NUMERIC_FORECAST_TEMPLATE.format(
+            question_text=question_text,
+            resolution_criteria=resolution_criteria,
+            lower_bound=lower_bound,
+            upper_bound=upper_bound,
+            open_lower=open_lower,
+            open_upper=open_upper,
+            research_section=research_section,
+        )
+
+        tasks = [
+            self._forecast_numeric_agent(agent, user_message, lower_bound, upper_bound)
+            for agent in self.agents
+        ]
+        forecasts = await asyncio.gather(*tasks)
 
-        final_cdf = self._aggregate_cdfs(forecasts, lower_bound, upper_bound)
         reasoning = self._summarize_reasoning(forecasts)
 
-        return CommitteeResult(
+        result = CommitteeResult(
             question_id=question_id,
             question_text=question_text,
             question_type="numeric",
-            research_context=research.to_prompt_section(),
+            research_context=research_section,
             agent_forecasts=forecasts,
             final_probability=0.5,
-            final_cdf=final_cdf,
             reasoning_summary=reasoning,
         )
+        result.final_cdf = result.aggregate_cdf()
+        return result
 
     async def forecast_multiple_choice(
         self,
@@ -145,45 +174,29 @@ class Forecaster:
             question_text,
             include_asknews=use_asknews,
             include_perplexity=use_perplexity,
+            rate_limiter=self.rate_limiter,
         )
         research = ResearchContext(
             question_text=question_text,
             adj_prior_section=research_str,
         )
+        research_section = research.to_prompt_section()
 
         from bot.prompts import MULTIPLE_CHOICE_TEMPLATE
-        from bot.utils import parse_option_probabilities
-
-        forecasts = []
-        for agent in self.agents:
-            user_message = MULTIPLE_CHOICE_TEMPLATE.format(
-                question_text=question_text,
-                resolution_criteria=resolution_criteria,
-                options_list="\n".join(f"- {opt}" for opt in options),
-                research_section=research.to_prompt_section(),
-                option_prob_format="\n".join(
-                    f"{opt}: [probability]" for opt in options
-                ),
-            )
 
-            response = await agent._call_llm(
-                messages=[{"role": "user", "content": user_message}],
-                model=self.model,
-            )
+        user_message = MULTIPLE_CHOICE_TEMPLATE.format(
+            question_text=question_text,
+            resolution_criteria=resolution_criteria,
+            options_list="\n".join(f"- {opt}" for opt in options),
+            research_section=research_section,
+            option_prob_format="\n".join(f"{opt}: [probability]" for opt in options),
+        )
 
-            option_probs = parse_option_probabilities(response, options)
-            total = sum(option_probs.values())
-            if total > 0:
-                option_probs = {k: v / total for k, v in option_probs.items()}
-
-            forecasts.append(
-                AgentForecast(
-                    agent_name=agent.name,
-                    weight=agent.weight,
-                    final_probability=0.5,
-                    final_reasoning=response,
-                )
-            )
+        tasks = [
+            self._forecast_multiple_choice_agent(agent, user_message, options)
+            for agent in self.agents
+        ]
+        forecasts = await asyncio.gather(*tasks)
 
         final_probs = self._aggregate_multiple_choice(forecasts, options)
         reasoning = self._summarize_reasoning(forecasts)
@@ -192,7 +205,7 @@ class Forecaster:
             question_id=question_id,
             question_text=question_text,
             question_type="multiple_choice",
-            research_context=research.to_prompt_section(),
+            research_context=research_section,
             agent_forecasts=forecasts,
             final_option_probs=final_probs,
             reasoning_summary=reasoning,
@@ -201,30 +214,21 @@ class Forecaster:
     async def _forecast_numeric_agent(
         self,
         agent: LLMAgent,
-        question_text: str,
-        resolution_criteria: str,
-        research: ResearchContext,
+        user_message: str,
         lower_bound: float,
         upper_bound: float,
-        open_lower: bool,
-        open_upper: bool,
     ) -> AgentForecast:
-        from bot.prompts import NUMERIC_FORECAST_TEMPLATE
-        from bot.utils import parse_percentiles, parse_median, extract_reasoning
-
-        user_message = NUMERIC_FORECAST_TEMPLATE.format(
-            question_text=question_text,
-            resolution_criteria=resolution_criteria,
-            lower_bound=lower_bound,
-            upper_bound=upper_bound,
-            open_lower=open_lower,
-            open_upper=open_upper,
-            research_section=research.to_prompt_section(),
+        from bot.utils import (
+            parse_percentiles,
+            parse_median,
+            extract_reasoning,
+            cdf_from_percentiles,
         )
 
         response = await agent._call_llm(
             messages=[{"role": "user", "content": user_message}],
             model=self.model,
+            max_tokens=FORECAST_MAX_TOKENS,
         )
 
         percentiles = parse_percentiles(response)
@@ -236,26 +240,43 @@ class Forecaster:
             weight=agent.weight,
             final_probability=median or (lower_bound + upper_bound) / 2,
             final_reasoning=reasoning,
+            final_cdf=(
+                cdf_from_percentiles(percentiles, lower_bound, upper_bound)
+                if percentiles
+                else None
+            ),
         )
 
-    def _aggregate_forecasts(self, forecasts: list[AgentForecast]) -> float:
-        probabilities = [f.final_probability for f in forecasts]
-        weights = [f.weight for f in forecasts]
-        return aggregate_logit_space(probabilities, weights)
+    async def _forecast_multiple_choice_agent(
+        self,
+        agent: LLMAgent,
+        user_message: str,
+        options: list[str],
+    ) -> AgentForecast:
+        from bot.utils import parse_option_probabilities
 
-    def _aggregate_cdfs(
-        self, forecasts: list[AgentForecast], lower: float, upper: float
-    ) -> list[float]:
-        from bot.utils import cdf_from_percentiles
+        response = await agent._call_llm(
+            messages=[{"role": "user", "content": user_message}],
+            model=self.model,
+            max_tokens=FORECAST_MAX_TOKENS,
+        )
 
-        weights = [f.weight for f in forecasts]
-        total_weight = sum(weights)
+        option_probs = parse_option_probabilities(response, options)
+        total = sum(option_probs.values())
+        if total > 0:
+            option_probs = {k: v / total for k, v in option_probs.items()}
 
-        aggregated = [0.0] * 201
-        for forecast in forecasts:
-            pass
+        return AgentForecast(
+            agent_name=agent.name,
+            weight=agent.weight,
+            final_probability=0.5,
+            final_reasoning=response,
+            final_option_probs=option_probs,
+        )
 
-        return aggregated
+    def _aggregate_forecasts(self, forecasts: list[AgentForecast]) -> float:
+        probabilities = [f.final_probability for f in forecasts]
+        return aggregate_logit_space(probabilities, self._norm_weights)
 
     def _aggregate_multiple_choice(
         self, forecasts: list[AgentForecast], options: list[str]
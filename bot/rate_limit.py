@@ -0,0 +1,65 @@
+"""Async rate limiting for outbound API calls."""
+
+import asyncio
+import time
+
+
+class TokenBucket:
+    """Token-bucket limiter allowing ``rate_per_minute`` acquisitions a minute.
+
+    Bursts up to one minute's worth of tokens are allowed. A rate of 0
+    disables limiting.
+    """
+
+    def __init__(self, rate_per_minute: float):
+        self.capacity = max(1.0, rate_per_minute)
+        self._refill_per_second = rate_per_minute / 60.0
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a token is available, then consume it."""
+        if self._refill_per_second <= 0:
+            return
+
+        async with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity,
+                self._tokens + (now - self._updated) * self._refill_per_second,
+            )
+            self._updated = now
+
+            # Reserve the token now (possibly going negative) so waiters are
+            # served in order, and sleep outside the lock.
+            self._tokens -= 1
+            delay = -self._tokens / self._refill_per_second if self._tokens < 0 else 0
+
+        if delay:
+            await asyncio.sleep(delay)
+
+
+class LeakyBucketLimiter:
+    """Spaces acquisitions at least ``1 / rps`` seconds apart, without bursts.
+
+    A rate of 0 disables limiting.
+    """
+
+    def __init__(self, rps: float):
+        self._interval = 1.0 / rps if rps > 0 else 0.0
+        self._lock = asyncio.Lock()
+        self._last = 0.0
+
+    async def acquire(self) -> None:
+        """Wait for this caller's slot."""
+        if not self._interval:
+            return
+
+        async with self._lock:
+            now = time.monotonic()
+            delay = max(0.0, self._last + self._interval - now)
+            self._last = now + delay
+
+        if delay:
+            await asyncio.sleep(delay)
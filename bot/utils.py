@@ -1,31 +1,53 @@
 """Utility functions for parsing and normalizing forecasts."""
 
 import re
+from functools import lru_cache
 from typing import Optional
 import numpy as np
 
+_PROB_PAT = re.compile(r"PROBABILITY:\s*([\d.]+)", re.IGNORECASE)
+_NUMBER_PAT = re.compile(r"\s*([\d.]+)")
+_PERCENT_PAT = re.compile(r"(\d+(?:\.\d+)?)\s*%")
+_RATIO_PAT = re.compile(r"(\d+(?:\.\d+)?)\s*(?:in|out of)\s*(\d+)", re.IGNORECASE)
+_ODDS_PAT = re.compile(r"(?:odds|chance|likelihood).*?(\d+(?:\.\d+)?)", re.IGNORECASE)
+_PCT_PAT = re.compile(r"\bp(10|20|30|40|50|60|70|80|90)\s*:\s*([\d.]+)", re.IGNORECASE)
+_MEDIAN_PAT = re.compile(r"MEDIAN:\s*([\d.]+)", re.IGNORECASE)
+_REASONING_PAT = re.compile(
+    r"REASONING:\s*(.*?)(?=PROBABILITY:|MEDIAN:|PROBABILITIES:|$)",
+    re.DOTALL | re.IGNORECASE,
+)
+
 
 def parse_probability(text: str) -> Optional[float]:
-    match = re.search(r"PROBABILITY:\s*([\d.]+)", text, re.IGNORECASE)
+    # Fast path for well-formed output: locate the label with str.find and
+    # only match the number right after it. lower() can change the length
+    # of some non-ASCII text, in which case indices would not line up.
+    lowered = text.lower()
+    if len(lowered) == len(text):
+        idx = lowered.find("probability:")
+        if idx >= 0:
+            match = _NUMBER_PAT.match(text, idx + len("probability:"))
+            if match:
+                return normalize_probability(float(match.group(1)))
+
+    match = _PROB_PAT.search(text)
     if match:
         prob = float(match.group(1))
         return normalize_probability(prob)
 
-    match = re.search(r"(\d+(?:\.\d+)?)\s*%", text)
+    match = _PERCENT_PAT.search(text)
     if match:
         prob = float(match.group(1)) / 100
         return normalize_probability(prob)
 
-    match = re.search(r"(\d+(?:\.\d+)?)\s*(?:in|out of)\s*(\d+)", text, re.IGNORECASE)
+    match = _RATIO_PAT.search(text)
     if match:
         num = float(match.group(1))
         denom = float(match.group(2))
         if denom > 0:
             return normalize_probability(num / denom)
 
-    match = re.search(
-        r"(?:odds|chance|likelihood).*?(\d+(?:\.\d+)?)", text, re.IGNORECASE
-    )
+    match = _ODDS_PAT.search(text)
     if match:
         prob = float(match.group(1))
         if prob > 1:
@@ -40,52 +62,72 @@ def normalize_probability(prob: float) -> float:
 
 
 def weighted_average(probabilities: list[float], weights: list[float]) -> float:
-    if not probabilities or not weights:
+    if len(probabilities) == 0 or len(weights) == 0:
         return 0.5
 
     if len(probabilities) != len(weights):
         raise ValueError("Probabilities and weights must have same length")
 
-    total_weight = sum(weights)
+    w = np.asarray(weights, dtype=np.float64)
+    total_weight = w.sum()
     if total_weight == 0:
         return 0.5
 
-    weighted_sum = sum(p * w for p, w in zip(probabilities, weights))
-    return weighted_sum / total_weight
+    return float(np.dot(np.asarray(probabilities, dtype=np.float64), w) / total_weight)
 
 
 def parse_percentiles(text: str) -> dict[int, float]:
     percentiles = {}
-    for p in [10, 20, 30, 40, 50, 60, 70, 80, 90]:
-        match = re.search(rf"p{p}:\s*([\d.]+)", text, re.IGNORECASE)
-        if match:
-            percentiles[p] = float(match.group(1))
+    for match in _PCT_PAT.finditer(text):
+        percentiles.setdefault(int(match.group(1)), float(match.group(2)))
     return percentiles
 
 
 def parse_median(text: str) -> Optional[float]:
-    match = re.search(r"MEDIAN:\s*([\d.]+)", text, re.IGNORECASE)
+    match = _MEDIAN_PAT.search(text)
     if match:
         return float(match.group(1))
     return None
 
 
+@lru_cache(maxsize=128)
+def _option_pattern(options: tuple[str, ...]) -> tuple[re.Pattern, dict[str, str]]:
+    # Longest first, so an option that prefixes another cannot shadow it
+    alternation = "|".join(
+        re.escape(opt) for opt in sorted(options, key=len, reverse=True)
+    )
+    pattern = re.compile(rf"({alternation}):\s*([\d.]+)", re.IGNORECASE)
+    return pattern, {opt.lower(): opt for opt in options}
+
+
 def parse_option_probabilities(text: str, options: list[str]) -> dict[str, float]:
+    if not options:
+        return {}
+
+    pattern, by_lower = _option_pattern(tuple(options))
     probs = {}
-    for option in options:
-        pattern = rf"{re.escape(option)}:\s*([\d.]+)"
-        match = re.search(pattern, text, re.IGNORECASE)
-        if match:
-            probs[option] = float(match.group(1))
-    return probs
+    for match in pattern.finditer(text):
+        option = by_lower.get(match.group(1).lower())
+        if option is not None:
+            probs.setdefault(option, float(match.group(2)))
+    return {opt: probs[opt] for opt in options if opt in probs}
 
 
 def extract_reasoning(text: str) -> str:
-    match = re.search(
-        r"REASONING:\s*(.*?)(?=PROBABILITY:|MEDIAN:|PROBABILITIES:|$)",
-        text,
-        re.DOTALL | re.IGNORECASE,
-    )
+    lowered = text.lower()
+    if len(lowered) == len(text):
+        start = lowered.find("reasoning:")
+        if start < 0:
+            return text.strip()
+        start += len("reasoning:")
+        end = len(text)
+        for label in ("probability:", "median:", "probabilities:"):
+            idx = lowered.find(label, start, end)
+            if idx >= 0:
+                end = idx
+        return text[start:end].strip()
+
+    match = _REASONING_PAT.search(text)
     if match:
         return match.group(1).strip()
     return text.strip()
@@ -94,37 +136,29 @@ def extract_reasoning(text: str) -> str:
 def cdf_from_percentiles(
     percentiles: dict[int, float], lower: float, upper: float
 ) -> list[float]:
-    cdf = [0.0] * 201
     sorted_p = sorted(percentiles.items())
+    xs = np.linspace(lower, upper, 201)
+
+    vals = np.array([v for _, v in sorted_p], dtype=np.float64)
+    pcts = np.array([p / 100 for p, _ in sorted_p], dtype=np.float64)
 
-    for i in range(201):
-        x = lower + (upper - lower) * i / 200
-
-        for j, (p, val) in enumerate(sorted_p):
-            if x < val:
-                if j == 0:
-                    cdf[i] = (
-                        p / 100 * (x - lower) / (val - lower) if val != lower else 0
-                    )
-                else:
-                    prev_p, prev_val = sorted_p[j - 1]
-                    t = (x - prev_val) / (val - prev_val) if val != prev_val else 0
-                    cdf[i] = (prev_p + t * (p - prev_p)) / 100
-                break
-        else:
-            cdf[i] = 1.0
+    # np.interp needs non-decreasing x-coordinates inside the bounds
+    vals = np.maximum.accumulate(np.clip(vals, lower, upper))
 
+    cdf = np.interp(
+        xs,
+        np.concatenate([[lower], vals, [upper]]),
+        np.concatenate([[0.0], pcts, [1.0]]),
+    )
+    cdf = np.maximum.accumulate(cdf)
     cdf[0] = 0.0
     cdf[-1] = 1.0
 
-    for i in range(1, 201):
-        cdf[i] = max(cdf[i], cdf[i - 1])
-
-    return cdf
+    return cdf.tolist()
 
 
 def logit(p: float) -> float:
-    p = max(0.0001, min(0.9999, p))
+    p = np.clip(p, 0.0001, 0.9999)
     return np.log(p / (1 - p))
 
 
@@ -133,6 +167,5 @@ def inv_logit(x: float) -> float:
 
 
 def aggregate_logit_space(probabilities: list[float], weights: list[float]) -> float:
-    logits = [logit(p) for p in probabilities]
-    avg_logit = weighted_average(logits, weights)
-    return inv_logit(avg_logit)
+    avg_logit = weighted_average(logit(np.asarray(probabilities)), weights)
+    return float(inv_logit(avg_logit))
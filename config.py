@@ -4,7 +4,7 @@ import os
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Config:
     """Centralized configuration loaded from environment variables."""
 
@@ -31,6 +31,9 @@ class Config:
     # Cache settings
     cache_ttl_seconds: int = 300
     cache_max_size: int = 1000
+    cache_dir: str = "cache"
+    llm_cache_ttl_seconds: int = 86400
+    adj_cache_ttl_seconds: int = 3600
 
     # Agent settings
     committee_size: int = 5
@@ -40,21 +43,31 @@ class Config:
     # Rate limiting
     max_concurrent_questions: int = 2
     requests_per_second: float = 1.0
+    max_concurrent_llm_calls: int = 32
+    llm_rpm: int = 50
+    adj_max_concurrency: int = 20
 
     @classmethod
     def from_env(cls) -> "Config":
         """Load configuration from environment variables."""
+        env = os.environ
         return cls(
-            metaculus_token=os.getenv("METACULUS_TOKEN", ""),
-            adj_api_key=os.getenv("ADJ_API_KEY", ""),
-            asknews_client_id=os.getenv("ASKNEWS_CLIENT_ID", ""),
-            asknews_secret=os.getenv("ASKNEWS_SECRET", ""),
-            perplexity_api_key=os.getenv("PERPLEXITY_API_KEY", ""),
-            exa_api_key=os.getenv("EXA_API_KEY", ""),
-            openrouter_api_key=os.getenv("OPENROUTER_API_KEY", ""),
-            anthropic_api_key=os.getenv("ANTHROPIC_API_KEY", ""),
-            cache_ttl_seconds=int(os.getenv("CACHE_TTL_SECONDS", "300")),
-            max_concurrent_questions=int(os.getenv("MAX_CONCURRENT_QUESTIONS", "2")),
+            metaculus_token=env.get("METACULUS_TOKEN", ""),
+            adj_api_key=env.get("ADJ_API_KEY", ""),
+            asknews_client_id=env.get("ASKNEWS_CLIENT_ID", ""),
+            asknews_secret=env.get("ASKNEWS_SECRET", ""),
+            perplexity_api_key=env.get("PERPLEXITY_API_KEY", ""),
+            exa_api_key=env.get("EXA_API_KEY", ""),
+            openrouter_api_key=env.get("OPENROUTER_API_KEY", ""),
+            anthropic_api_key=env.get("ANTHROPIC_API_KEY", ""),
+            cache_ttl_seconds=int(env.get("CACHE_TTL_SECONDS", "300")),
+            cache_dir=env.get("CACHE_DIR", "cache"),
+            llm_cache_ttl_seconds=int(env.get("LLM_CACHE_TTL_SECONDS", "86400")),
+            adj_cache_ttl_seconds=int(env.get("ADJ_CACHE_TTL_SECONDS", "3600")),
+            max_concurrent_questions=int(env.get("MAX_CONCURRENT_QUESTIONS", "2")),
+            max_concurrent_llm_calls=int(env.get("MAX_CONCURRENT_LLM_CALLS", "32")),
+            llm_rpm=int(env.get("LLM_RPM", "50")),
+            adj_max_concurrency=int(env.get("ADJ_MAX_CONCURRENCY", "20")),
         )
 
 
@@ -10,9 +10,9 @@ Uses:
 import argparse
 import asyncio
 import logging
-import os
-from datetime import datetime
-from typing import Literal
+import re
+from datetime import date
+from typing import Any, Literal, Optional
 
 from forecasting_tools import (
     BinaryQuestion,
@@ -29,13 +29,87 @@ from forecasting_tools import (
 )
 
 from config import config
-from bot.forecaster import Forecaster, forecast_question
-from bot.utils import weighted_average
-from models.schemas import CommitteeResult, ResearchContext
+from bot.agents import LLMAgent
+from bot.forecaster import Forecaster
+from bot.rate_limit import LeakyBucketLimiter
+from bot.utils import parse_option_probabilities
+from models.schemas import CommitteeResult
+from research.adj_client import close_shared_session
 from research.integrated_search import integrated_research
 
 logger = logging.getLogger(__name__)
 
+_PROB_RE = re.compile(r"Probability:\s*([\d.]+)%", re.IGNORECASE)
+_MEDIAN_RE = re.compile(r"Median:\s*([\d.]+)", re.IGNORECASE)
+
+# SimpleVoxForecaster prompts, dedented once at import and filled per call
+_SIMPLE_BINARY_TEMPLATE = clean_indents(
+    """
+    You are a professional forecaster using base-rate thinking.
+
+    Question: {question_text}
+
+    Background: {background}
+
+    Resolution Criteria: {resolution_criteria}
+
+    Research Data:
+    {research}
+
+    Today is {today}.
+
+    Instructions:
+    1. Consider base rates from historical data
+    2. Weight prediction market prices heavily if available
+    3. Consider the status quo bias
+    4. Provide your probability as: Probability: XX%
+
+    Provide your reasoning first, then the probability.
+    """
+)
+
+_SIMPLE_MULTIPLE_CHOICE_TEMPLATE = clean_indents(
+    """
+    You are a professional forecaster.
+
+    Question: {question_text}
+
+    Options: {options}
+
+    Research: {research}
+
+    Provide probabilities for each option. Format:
+    Option: Probability%
+    """
+)
+
+_SIMPLE_NUMERIC_TEMPLATE = clean_indents(
+    """
+    You are a professional forecaster.
+
+    Question: {question_text}
+
+    Range: {lower_bound} to {upper_bound}
+
+    Research: {research}
+
+    Provide your median estimate. Format: Median: XX
+    """
+)
+
+
+def _as_option_list(
+    probs: Optional[dict[str, float]], options: list[str]
+) -> PredictedOptionList:
+    """Wrap option probabilities for submission, falling back to uniform."""
+    if not probs:
+        probs = dict.fromkeys(options, 1.0 / len(options))
+    return PredictedOptionList(
+        predicted_option_list=[
+            {"option_name": k, "probability": v} for k, v in probs.items()
+        ]
+    )
+
 
 class VoxForecaster(ForecastBot):
     """Multi-agent committee forecasting bot.
@@ -45,147 +119,146 @@ class VoxForecaster(ForecastBot):
     - 5-agent committee with peer review
     """
 
-    _max_concurrent_questions = 2
-    _concurrency_limiter = asyncio.Semaphore(_max_concurrent_questions)
+    # Question type -> Forecaster coroutine that handles it
+    _COMMITTEE_METHODS = {
+        BinaryQuestion: "forecast_binary",
+        MultipleChoiceQuestion: "forecast_multiple_choice",
+        NumericQuestion: "forecast_numeric",
+    }
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
+        self._concurrency_limiter: Optional[asyncio.Semaphore] = None
+        self._rate_limiter = LeakyBucketLimiter(config.requests_per_second)
+        self._use_asknews = bool(config.asknews_client_id and config.asknews_secret)
+        self._use_perplexity = bool(config.perplexity_api_key)
         self._committee_forecaster = Forecaster(
             use_peer_review=True,
             model="claude-sonnet-4-20250514",
+            rate_limiter=self._rate_limiter,
         )
 
+    def _limiter(self) -> asyncio.Semaphore:
+        """Per-instance question limiter, created inside the running loop."""
+        if self._concurrency_limiter is None:
+            self._concurrency_limiter = asyncio.Semaphore(
+                config.max_concurrent_questions
+            )
+        return self._concurrency_limiter
+
     async def run_research(self, question: MetaculusQuestion) -> str:
         """Run integrated research from ADJ, AskNews, and Perplexity."""
-        async with self._concurrency_limiter:
+        async with self._limiter():
             research = await integrated_research(
                 question=question.question_text,
-                include_asknews=bool(
-                    config.asknews_client_id and config.asknews_secret
-                ),
-                include_perplexity=bool(config.perplexity_api_key),
+                include_asknews=self._use_asknews,
+                include_perplexity=self._use_perplexity,
+                rate_limiter=self._rate_limiter,
             )
-            logger.info(f"Research for {question.page_url}:\n{research[:500]}...")
-            return research
+        logger.info("Research for %s:\n%.500s...", question.page_url, research)
+        return research
+
+    async def _forecast(
+        self, question: MetaculusQuestion, **kwargs: Any
+    ) -> CommitteeResult:
+        """Run the committee method matching the question's type."""
+        for cls in type(question).__mro__:
+            if cls in self._COMMITTEE_METHODS:
+                method = getattr(
+                    self._committee_forecaster, self._COMMITTEE_METHODS[cls]
+                )
+                break
+        else:
+            raise ValueError(f"Unsupported question type: {type(question).__name__}")
+
+        return await method(
+            question_id=question.id,
+            question_text=question.question_text,
+            resolution_criteria=self._format_criteria(question),
+            use_adj=True,
+            use_asknews=False,
+            use_perplexity=False,
+            **kwargs,
+        )
 
     async def _run_forecast_on_binary(
         self, question: BinaryQuestion, research: str
     ) -> ReasonedPrediction[float]:
         """Forecast binary question using multi-agent committee."""
-        async with self._concurrency_limiter:
-            context = ResearchContext(
-                question_text=question.question_text,
-                adj_prior_section=research,
-            )
+        result = await self._forecast(question)
 
-            result = await self._committee_forecaster.forecast_binary(
-                question_id=question.id,
-                question_text=question.question_text,
-                resolution_criteria=self._format_criteria(question),
-                use_adj=True,
-                use_asknews=False,
-                use_perplexity=False,
-            )
-
-            logger.info(
-                f"Committee forecast for {question.page_url}: "
-                f"{result.final_probability:.2%}"
-            )
+        logger.info(
+            "Committee forecast for %s: %.2f%%",
+            question.page_url,
+            result.final_probability * 100,
+        )
 
-            return ReasonedPrediction(
-                prediction_value=result.final_probability,
-                reasoning=result.reasoning_summary,
-            )
+        return ReasonedPrediction(
+            prediction_value=result.final_probability,
+            reasoning=result.reasoning_summary,
+        )
 
     async def _run_forecast_on_multiple_choice(
         self, question: MultipleChoiceQuestion, research: str
     ) -> ReasonedPrediction[PredictedOptionList]:
         """Forecast multiple choice question using committee."""
-        async with self._concurrency_limiter:
-            result = await self._committee_forecaster.forecast_multiple_choice(
-                question_id=question.id,
-                question_text=question.question_text,
-                resolution_criteria=self._format_criteria(question),
-                options=question.options,
-                use_adj=True,
-                use_asknews=False,
-                use_perplexity=False,
-            )
+        result = await self._forecast(question, options=question.options)
 
-            if result.final_option_probs:
-                predicted_options = PredictedOptionList(
-                    predicted_option_list=[
-                        {"option_name": k, "probability": v}
-                        for k, v in result.final_option_probs.items()
-                    ]
-                )
-            else:
-                uniform_prob = 1.0 / len(question.options)
-                predicted_options = PredictedOptionList(
-                    predicted_option_list=[
-                        {"option_name": opt, "probability": uniform_prob}
-                        for opt in question.options
-                    ]
-                )
+        predicted_options = _as_option_list(result.final_option_probs, question.options)
 
-            logger.info(
-                f"Committee MC forecast for {question.page_url}: {result.final_option_probs}"
-            )
+        logger.info(
+            "Committee MC forecast for %s: %s",
+            question.page_url,
+            result.final_option_probs,
+        )
 
-            return ReasonedPrediction(
-                prediction_value=predicted_options,
-                reasoning=result.reasoning_summary,
-            )
+        return ReasonedPrediction(
+            prediction_value=predicted_options,
+            reasoning=result.reasoning_summary,
+        )
 
     async def _run_forecast_on_numeric(
         self, question: NumericQuestion, research: str
     ) -> ReasonedPrediction[NumericDistribution]:
         """Forecast numeric question using committee."""
-        async with self._concurrency_limiter:
-            result = await self._committee_forecaster.forecast_numeric(
-                question_id=question.id,
-                question_text=question.question_text,
-                resolution_criteria=self._format_criteria(question),
-                lower_bound=question.lower_bound,
-                upper_bound=question.upper_bound,
-                open_lower=question.open_lower_bound,
-                open_upper=question.open_upper_bound,
-                use_adj=True,
-                use_asknews=False,
-                use_perplexity=False,
-            )
-
-            if result.final_cdf:
-                numeric_dist = NumericDistribution(
-                    declared_density_values=result.final_cdf
-                )
-            else:
-                median = result.final_probability
-                numeric_dist = NumericDistribution.from_central_prediction(
-                    central_prediction=median,
-                    question=question,
-                    spread=0.2,
-                )
+        result = await self._forecast(
+            question,
+            lower_bound=question.lower_bound,
+            upper_bound=question.upper_bound,
+            open_lower=question.open_lower_bound,
+            open_upper=question.open_upper_bound,
+        )
 
-            logger.info(
-                f"Committee numeric forecast for {question.page_url}: median={result.final_probability}"
+        if result.final_cdf:
+            numeric_dist = NumericDistribution(declared_density_values=result.final_cdf)
+        else:
+            median = result.final_probability
+            numeric_dist = NumericDistribution.from_central_prediction(
+                central_prediction=median,
+                question=question,
+                spread=0.2,
             )
 
-            return ReasonedPrediction(
-                prediction_value=numeric_dist,
-                reasoning=result.reasoning_summary,
-            )
+        logger.info(
+            "Committee numeric forecast for %s: median=%s",
+            question.page_url,
+            result.final_probability,
+        )
+
+        return ReasonedPrediction(
+            prediction_value=numeric_dist,
+            reasoning=result.reasoning_summary,
+        )
 
     def _format_criteria(self, question: MetaculusQuestion) -> str:
         """Format resolution criteria for prompt."""
-        parts = []
-        if hasattr(question, "resolution_criteria") and question.resolution_criteria:
-            parts.append(question.resolution_criteria)
-        if hasattr(question, "fine_print") and question.fine_print:
-            parts.append(question.fine_print)
-        if hasattr(question, "background_info") and question.background_info:
-            parts.append(f"Background: {question.background_info}")
-        return "\n\n".join(parts) if parts else "No specific criteria provided."
+        background = getattr(question, "background_info", None)
+        parts = [
+            getattr(question, "resolution_criteria", None),
+            getattr(question, "fine_print", None),
+            f"Background: {background}" if background else None,
+        ]
+        return "\n\n".join(p for p in parts if p) or "No specific criteria provided."
 
 
 class SimpleVoxForecaster(ForecastBot):
@@ -194,52 +267,57 @@ class SimpleVoxForecaster(ForecastBot):
     Uses ADJ research but simpler forecasting without full committee.
     """
 
-    _max_concurrent_questions = 2
-    _concurrency_limiter = asyncio.Semaphore(_max_concurrent_questions)
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._concurrency_limiter: Optional[asyncio.Semaphore] = None
+        self._rate_limiter = LeakyBucketLimiter(config.requests_per_second)
+        self._use_asknews = bool(config.asknews_client_id and config.asknews_secret)
+        self._use_perplexity = bool(config.perplexity_api_key)
+        self._today_date: Optional[date] = None
+        self._today_str = ""
+
+    def _limiter(self) -> asyncio.Semaphore:
+        """Per-instance question limiter, created inside the running loop."""
+        if self._concurrency_limiter is None:
+            self._concurrency_limiter = asyncio.Semaphore(
+                config.max_concurrent_questions
+            )
+        return self._concurrency_limiter
+
+    @property
+    def _today(self) -> str:
+        """Today's ISO date, reformatted only when the day rolls over."""
+        today = date.today()
+        if today != self._today_date:
+            self._today_date = today
+            self._today_str = today.isoformat()
+        return self._today_str
 
     async def run_research(self, question: MetaculusQuestion) -> str:
         """Run integrated research."""
-        async with self._concurrency_limiter:
+        async with self._limiter():
             return await integrated_research(
                 question=question.question_text,
-                include_asknews=bool(config.asknews_client_id),
-                include_perplexity=bool(config.perplexity_api_key),
+                include_asknews=self._use_asknews,
+                include_perplexity=self._use_perplexity,
+                rate_limiter=self._rate_limiter,
             )
 
     async def _run_forecast_on_binary(
         self, question: BinaryQuestion, research: str
     ) -> ReasonedPrediction[float]:
-        prompt = clean_indents(
-            f"""
-            You are a professional forecaster using base-rate thinking.
-
-            Question: {question.question_text}
-
-            Background: {question.background_info or "N/A"}
-
-            Resolution Criteria: {question.resolution_criteria or "N/A"}
-
-            Research Data:
-            {research}
-
-            Today is {datetime.now().strftime("%Y-%m-%d")}.
-
-            Instructions:
-            1. Consider base rates from historical data
-            2. Weight prediction market prices heavily if available
-            3. Consider the status quo bias
-            4. Provide your probability as: Probability: XX%
-
-            Provide your reasoning first, then the probability.
-            """
+        prompt = _SIMPLE_BINARY_TEMPLATE.format(
+            question_text=question.question_text,
+            background=question.background_info or "N/A",
+            resolution_criteria=question.resolution_criteria or "N/A",
+            research=research,
+            today=self._today,
         )
 
         reasoning = await self.get_llm("default", "llm").invoke(prompt)
-        logger.info(f"Reasoning for {question.page_url}:\n{reasoning}")
-
-        import re
+        logger.info("Reasoning for %s:\n%s", question.page_url, reasoning)
 
-        match = re.search(r"Probability:\s*([\d.]+)%", reasoning, re.IGNORECASE)
+        match = _PROB_RE.search(reasoning)
         if match:
             prob = float(match.group(1)) / 100
             prob = max(0.01, min(0.99, prob))
@@ -251,43 +329,20 @@ class SimpleVoxForecaster(ForecastBot):
     async def _run_forecast_on_multiple_choice(
         self, question: MultipleChoiceQuestion, research: str
     ) -> ReasonedPrediction[PredictedOptionList]:
-        prompt = clean_indents(
-            f"""
-            You are a professional forecaster.
-
-            Question: {question.question_text}
-
-            Options: {question.options}
-
-            Research: {research}
-
-            Provide probabilities for each option. Format:
-            Option: Probability%
-            """
+        prompt = _SIMPLE_MULTIPLE_CHOICE_TEMPLATE.format(
+            question_text=question.question_text,
+            options=question.options,
+            research=research,
         )
 
         reasoning = await self.get_llm("default", "llm").invoke(prompt)
 
-        import re
-
-        probs = {}
-        for opt in question.options:
-            match = re.search(
-                rf"{re.escape(opt)}:\s*([\d.]+)%", reasoning, re.IGNORECASE
-            )
-            if match:
-                probs[opt] = float(match.group(1)) / 100
-
+        # Percentages are normalized below, so no need to divide by 100 first
+        probs = parse_option_probabilities(reasoning, question.options)
         total = sum(probs.values())
-        if total > 0:
-            probs = {k: v / total for k, v in probs.items()}
-        else:
-            probs = {opt: 1.0 / len(question.options) for opt in question.options}
-
-        predicted_options = PredictedOptionList(
-            predicted_option_list=[
-                {"option_name": k, "probability": v} for k, v in probs.items()
-            ]
+        predicted_options = _as_option_list(
+            {k: v / total for k, v in probs.items()} if total > 0 else None,
+            question.options,
         )
 
         return ReasonedPrediction(
@@ -297,25 +352,16 @@ class SimpleVoxForecaster(ForecastBot):
     async def _run_forecast_on_numeric(
         self, question: NumericQuestion, research: str
     ) -> ReasonedPrediction[NumericDistribution]:
-        prompt = clean_indents(
-            f"""
-            You are a professional forecaster.
-
-            Question: {question.question_text}
-
-            Range: {question.lower_bound} to {question.upper_bound}
-
-            Research: {research}
-
-            Provide your median estimate. Format: Median: XX
-            """
+        prompt = _SIMPLE_NUMERIC_TEMPLATE.format(
+            question_text=question.question_text,
+            lower_bound=question.lower_bound,
+            upper_bound=question.upper_bound,
+            research=research,
         )
 
         reasoning = await self.get_llm("default", "llm").invoke(prompt)
 
-        import re
-
-        match = re.search(r"Median:\s*([\d.]+)", reasoning, re.IGNORECASE)
+        match = _MEDIAN_RE.search(reasoning)
         if match:
             median = float(match.group(1))
         else:
@@ -361,6 +407,55 @@ def create_bot(use_committee: bool = True, **kwargs) -> ForecastBot:
         return SimpleVoxForecaster(**defaults)
 
 
+async def _fetch_questions(
+    urls: list[str], max_concurrency: int = 10
+) -> list[MetaculusQuestion]:
+    """Fetch questions by URL concurrently.
+
+    MetaculusApi lookups are blocking, so each runs in a worker thread.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def fetch(url: str) -> MetaculusQuestion:
+        async with semaphore:
+            return await asyncio.to_thread(MetaculusApi.get_question_by_url, url)
+
+    return list(await asyncio.gather(*(fetch(url) for url in urls)))
+
+
+async def _main(
+    bot: ForecastBot,
+    run_mode: Literal["tournament", "metaculus_cup", "test_questions"],
+) -> list:
+    """Run the bot for ``run_mode``, then close the shared HTTP clients."""
+    try:
+        if run_mode == "tournament":
+            return await bot.forecast_on_tournament(
+                MetaculusApi.CURRENT_AI_COMPETITION_ID,
+                return_exceptions=True,
+            )
+
+        elif run_mode == "metaculus_cup":
+            bot.skip_previously_forecasted_questions = False
+            return await bot.forecast_on_tournament(
+                MetaculusApi.CURRENT_METACULUS_CUP_ID,
+                return_exceptions=True,
+            )
+
+        elif run_mode == "test_questions":
+            EXAMPLE_QUESTIONS = [
+                "https://www.metaculus.com/questions/36248/who-will-be-the-first-to-leave-the-trump-cabinet/",
+            ]
+            bot.skip_previously_forecasted_questions = False
+            questions = await _fetch_questions(EXAMPLE_QUESTIONS)
+            return await bot.forecast_questions(questions, return_exceptions=True)
+
+        raise ValueError(f"Unknown run mode: {run_mode}")
+    finally:
+        await LLMAgent.aclose()
+        await close_shared_session()
+
+
 if __name__ == "__main__":
     logging.basicConfig(
         level=logging.INFO,
@@ -398,32 +493,14 @@ if __name__ == "__main__":
         publish_reports_to_metaculus=not args.no_publish,
     )
 
-    if run_mode == "tournament":
-        main_reports = asyncio.run(
-            bot.forecast_on_tournament(
-                MetaculusApi.CURRENT_AI_COMPETITION_ID,
-                return_exceptions=True,
-            )
-        )
-        forecast_reports = main_reports
+    # uvloop is optional; the stock event loop works, just slower
+    try:
+        import uvloop
 
-    elif run_mode == "metaculus_cup":
-        bot.skip_previously_forecasted_questions = False
-        forecast_reports = asyncio.run(
-            bot.forecast_on_tournament(
-                MetaculusApi.CURRENT_METACULUS_CUP_ID,
-                return_exceptions=True,
-            )
-        )
+        uvloop.install()
+    except ImportError:
+        pass
 
-    elif run_mode == "test_questions":
-        EXAMPLE_QUESTIONS = [
-            "https://www.metaculus.com/questions/36248/who-will-be-the-first-to-leave-the-trump-cabinet/",
-        ]
-        bot.skip_previously_forecasted_questions = False
-        questions = [MetaculusApi.get_question_by_url(url) for url in EXAMPLE_QUESTIONS]
-        forecast_reports = asyncio.run(
-            bot.forecast_questions(questions, return_exceptions=True)
-        )
+    forecast_reports = asyncio.run(_main(bot, run_mode))
 
     ForecastBot.log_report_summary(forecast_reports)
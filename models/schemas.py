@@ -1,7 +1,9 @@
 """Pydantic schemas for ADJ API responses."""
 
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional, Any
+import numpy as np
 from pydantic import BaseModel, Field
 
 
@@ -135,37 +137,43 @@ class SearchResult(BaseModel):
     results: list[SearchMatch] = Field(default_factory=list)
 
 
-# Request/Response models for internal use
+# Internal data structures. These are only built by our own code, so they are
+# plain dataclasses and skip Pydantic validation.
 
 
-class ResearchContext(BaseModel):
+@dataclass(slots=True)
+class ResearchContext:
     """Compiled research context for a question."""
 
     question_text: str
-    adj_markets: list[dict] = Field(default_factory=list)
+    adj_markets: list[dict] = field(default_factory=list)
     adj_prior: Optional[float] = None
     adj_prior_section: str = ""
     asknews_summary: str = ""
     perplexity_research: str = ""
-    compiled_at: datetime = Field(default_factory=datetime.now)
+    compiled_at: datetime = field(default_factory=datetime.now)
 
     def to_prompt_section(self) -> str:
         """Format research as a prompt section."""
-        sections = []
-
-        if self.adj_prior_section:
-            sections.append(f"### Prediction Market Data\n{self.adj_prior_section}")
-
-        if self.asknews_summary:
-            sections.append(f"### Recent News\n{self.asknews_summary}")
-
-        if self.perplexity_research:
-            sections.append(f"### Deep Research\n{self.perplexity_research}")
-
-        return "\n\n".join(sections)
-
-
-class AgentForecast(BaseModel):
+        # Join headers and bodies in one pass; the bodies can be many KB and
+        # f-string sections would copy each of them twice.
+        parts = []
+        for header, body in (
+            ("### Prediction Market Data\n", self.adj_prior_section),
+            ("### Recent News\n", self.asknews_summary),
+            ("### Deep Research\n", self.perplexity_research),
+        ):
+            if body:
+                if parts:
+                    parts.append("\n\n")
+                parts.append(header)
+                parts.append(body)
+
+        return "".join(parts)
+
+
+@dataclass(slots=True)
+class AgentForecast:
     """A forecast from a single agent."""
 
     agent_name: str
@@ -175,17 +183,30 @@ class AgentForecast(BaseModel):
     peer_critique: str = ""
     final_probability: float = 0.5
     final_reasoning: str = ""
+    final_cdf: Optional[list[float]] = None
+    final_option_probs: Optional[dict[str, float]] = None
 
 
-class CommitteeResult(BaseModel):
+@dataclass(slots=True)
+class CommitteeResult:
     """Final result from committee forecasting."""
 
     question_id: int
     question_text: str
     question_type: str
     research_context: str
-    agent_forecasts: list[AgentForecast] = Field(default_factory=list)
+    agent_forecasts: list[AgentForecast] = field(default_factory=list)
     final_probability: float = 0.5
     final_cdf: Optional[list[float]] = None
     final_option_probs: Optional[dict[str, float]] = None
     reasoning_summary: str = ""
+
+    def aggregate_cdf(self) -> Optional[list[float]]:
+        """Weight-average the agents' CDFs, skipping agents without one."""
+        with_cdf = [f for f in self.agent_forecasts if f.final_cdf]
+        if not with_cdf:
+            return None
+
+        weights = np.fromiter((f.weight for f in with_cdf), dtype=np.float64)
+        cdfs = np.array([f.final_cdf for f in with_cdf], dtype=np.float64)
+        return np.average(cdfs, axis=0, weights=weights).tolist()
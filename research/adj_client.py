@@ -1,66 +1,183 @@
 """ADJ Political Index API client with caching.
 
+Responses are cached in memory for the current process and, when a disk tier
+is configured, in an SQLite file under ``config.cache_dir`` so reruns skip
+the network entirely.
+
 API Base: https://v2.api.adj.news/api/v1
 """
 
 import asyncio
 import hashlib
+import json
+import os
 import time
-from typing import Optional, Any
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Callable, Optional, Any, TYPE_CHECKING, Union
 import aiohttp
 import logging
+import orjson
+from yarl import URL
 
 from config import config
 
+if TYPE_CHECKING:
+    from bot.cache import DiskCache
+    from bot.rate_limit import LeakyBucketLimiter
+
 logger = logging.getLogger(__name__)
 
+# Market fields each get_market_prior section reads
+_DIRECT_MATCH_FIELDS = ("platform", "question", "probability", "volume")
+_RELATED_MARKET_FIELDS = ("platform", "question", "probability")
 
-class ResponseCache:
-    """In-memory cache with TTL for API response deduplication."""
+# Direct-match candidates fetched concurrently per round in get_market_prior
+_DIRECT_MATCH_BATCH_SIZE = 3
 
-    def __init__(self, ttl_seconds: int = 300, max_size: int = 1000):
-        self.cache: dict[str, dict[str, Any]] = {}
-        self.ttl = ttl_seconds
-        self.max_size = max_size
-        self._lock = asyncio.Lock()
-
-    def _hash(self, key: str) -> str:
-        return hashlib.md5(key.encode()).hexdigest()
-
-    async def get(self, key: str) -> Optional[Any]:
-        """Get cached response if not expired."""
-        async with self._lock:
-            hashed = self._hash(key)
-            if hashed in self.cache:
-                entry = self.cache[hashed]
-                if time.time() - entry["timestamp"] < self.ttl:
-                    logger.debug(f"Cache HIT for {key[:50]}...")
-                    return entry["data"]
-                else:
-                    del self.cache[hashed]
-            logger.debug(f"Cache MISS for {key[:50]}...")
-            return None
+# Cached in place of a 404 response, so missing entities aren't refetched
+_NOT_FOUND = object()
 
-    async def set(self, key: str, data: Any) -> None:
-        """Cache response with timestamp."""
-        async with self._lock:
-            if len(self.cache) >= self.max_size:
-                # Remove oldest entries
-                sorted_keys = sorted(
-                    self.cache.keys(), key=lambda k: self.cache[k]["timestamp"]
-                )
-                for old_key in sorted_keys[: len(self.cache) // 4]:
-                    del self.cache[old_key]
+# One pooled session for all research HTTP calls, so connections, TLS
+# sessions and DNS lookups are reused across requests and clients. A session
+# is tied to the event loop that created it.
+_shared_session: Optional[aiohttp.ClientSession] = None
+_shared_session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+async def get_shared_session() -> aiohttp.ClientSession:
+    """Get or create the shared research HTTP session for the running loop.
+
+    Close it with close_shared_session() before the event loop ends.
+    """
+    global _shared_session, _shared_session_loop
+    loop = asyncio.get_running_loop()
+    if _shared_session is not None and _shared_session_loop is not loop:
+        # Left open by an earlier event loop, which can no longer close it
+        _shared_session.detach()
+        _shared_session = None
+    # No await between the check and the assignment, so concurrent callers
+    # on the event loop can't both see a missing session; keep it that way
+    # rather than adding a lock.
+    if _shared_session is None or _shared_session.closed:
+        _shared_session_loop = loop
+        _shared_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=100,
+                limit_per_host=config.adj_max_concurrency,
+                ttl_dns_cache=300,
+            )
+        )
+    return _shared_session
+
+
+async def close_shared_session() -> None:
+    """Close the shared research HTTP session, if one was opened."""
+    global _shared_session
+    if _shared_session is not None:
+        await _shared_session.close()
+        _shared_session = None
+
+
+@lru_cache(maxsize=1024)
+def _endpoint_url(base_url: str, endpoint: str) -> URL:
+    """Parse each endpoint URL once instead of on every request."""
+    return URL(base_url + endpoint)
 
-            hashed = self._hash(key)
-            self.cache[hashed] = {"data": data, "timestamp": time.time()}
-            logger.debug(f"Cache SET for {key[:50]}...")
 
-    async def clear(self) -> None:
-        """Clear all cached entries."""
-        async with self._lock:
-            self.cache.clear()
-            logger.info("Cache cleared")
+def _default_hasher(key: str) -> int:
+    """Fast 64-bit BLAKE2b fingerprint of a cache key, stable across runs."""
+    return int.from_bytes(
+        hashlib.blake2b(key.encode(), digest_size=8).digest(), "little"
+    )
+
+
+class ResponseCache:
+    """In-memory LRU cache with TTL for API response deduplication.
+
+    Optionally backed by a ``DiskCache`` holding orjson-encoded payloads, so
+    responses survive across processes. Negative (404) entries stay in memory.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: int = 300,
+        max_size: int = 1000,
+        hasher: Callable[[str], int] = _default_hasher,
+        disk: Optional["DiskCache"] = None,
+        disk_ttl_seconds: int = 3600,
+    ):
+        # Entries are (monotonic expiry time, data)
+        self.cache: OrderedDict[int, tuple[float, Any]] = OrderedDict()
+        self.ttl = ttl_seconds
+        self.max_size = max_size
+        self._hasher = hasher
+        self.disk = disk
+        self.disk_ttl = disk_ttl_seconds
+
+    def _hash(self, key: Union[str, int]) -> int:
+        # Keys from make_key are already fingerprints
+        return key if isinstance(key, int) else self._hasher(key)
+
+    def make_key(self, *parts: Any) -> int:
+        """Fingerprint a structured key, e.g. (method, endpoint, params, body)."""
+        return self._hasher(json.dumps(parts, sort_keys=True, default=str))
+
+    # The in-memory tier is only touched between awaits, so each lookup or
+    # update runs atomically on the event loop and needs no lock.
+
+    async def get(self, key: Union[str, int]) -> Optional[Any]:
+        """Get cached response if not expired, checking memory before disk."""
+        hashed = self._hash(key)
+        entry = self.cache.get(hashed)
+        if entry is not None:
+            expires_at, data = entry
+            if time.monotonic() < expires_at:
+                self.cache.move_to_end(hashed)
+                logger.debug("Cache HIT for %.50s...", key)
+                return data
+            else:
+                del self.cache[hashed]
+
+        if self.disk is not None:
+            raw = await asyncio.to_thread(self.disk.get, f"{hashed:016x}")
+            if raw is not None:
+                logger.debug("Disk cache HIT for %.50s...", key)
+                data = orjson.loads(raw)
+                self._remember(hashed, data, self.ttl)
+                return data
+
+        logger.debug("Cache MISS for %.50s...", key)
+        return None
+
+    async def set(
+        self, key: Union[str, int], data: Any, ttl: Optional[float] = None
+    ) -> None:
+        """Cache response until the TTL (default: the cache's) elapses.
+
+        Only entries using the default TTL are written to disk.
+        """
+        hashed = self._hash(key)
+        self._remember(hashed, data, self.ttl if ttl is None else ttl)
+        logger.debug("Cache SET for %.50s...", key)
+        if self.disk is not None and ttl is None:
+            await asyncio.to_thread(
+                self.disk.set,
+                f"{hashed:016x}",
+                orjson.dumps(data).decode(),
+                self.disk_ttl,
+            )
+
+    def _remember(self, hashed: int, data: Any, ttl: float) -> None:
+        self.cache[hashed] = (time.monotonic() + ttl, data)
+        self.cache.move_to_end(hashed)
+        while len(self.cache) > self.max_size:
+            self.cache.popitem(last=False)
+
+    def clear(self) -> None:
+        """Clear the in-memory tier."""
+        self.cache.clear()
+        logger.info("Cache cleared")
 
 
 class AdjClient:
@@ -81,25 +198,42 @@ class AdjClient:
         api_key: Optional[str] = None,
         cache_ttl: int = 300,
         timeout: int = 30,
+        rate_limiter: Optional["LeakyBucketLimiter"] = None,
+        not_found_ttl: int = 60,
+        persist_cache: bool = True,
     ):
         self.api_key = api_key or config.adj_api_key
-        self.cache = ResponseCache(ttl_seconds=cache_ttl)
+        disk = None
+        if persist_cache:
+            # Imported lazily: the bot package imports research at load time
+            from bot.cache import DiskCache
+
+            disk = DiskCache(os.path.join(config.cache_dir, "adj_responses.sqlite3"))
+        self.cache = ResponseCache(
+            ttl_seconds=cache_ttl,
+            disk=disk,
+            disk_ttl_seconds=config.adj_cache_ttl_seconds,
+        )
+        self.not_found_ttl = not_found_ttl
+        self._semaphore = asyncio.Semaphore(config.adj_max_concurrency)
+        # Cache key -> task currently fetching it
+        self._inflight: dict[int, asyncio.Task] = {}
         self.timeout = aiohttp.ClientTimeout(total=timeout)
-        self._session: Optional[aiohttp.ClientSession] = None
+        self.rate_limiter = rate_limiter
+        self._default_headers = (
+            {"Authorization": f"Bearer {self.api_key}"} if self.api_key else {}
+        )
 
     async def __aenter__(self) -> "AdjClient":
-        self._session = aiohttp.ClientSession(timeout=self.timeout)
         return self
 
     async def __aexit__(self, *args) -> None:
-        if self._session:
-            await self._session.close()
-            self._session = None
+        # Closes the shared session, so only use ``async with`` for
+        # standalone clients; the bot closes it once at shutdown instead.
+        await close_shared_session()
 
-    def _get_session(self) -> aiohttp.ClientSession:
-        if not self._session:
-            self._session = aiohttp.ClientSession(timeout=self.timeout)
-        return self._session
+    async def _get_session(self) -> aiohttp.ClientSession:
+        return await get_shared_session()
 
     async def _request(
         self,
@@ -108,49 +242,105 @@ class AdjClient:
         params: Optional[dict] = None,
         json_data: Optional[dict] = None,
         use_cache: bool = True,
+        rate_limiter: Optional["LeakyBucketLimiter"] = None,
     ) -> Any:
-        """Make HTTP request with caching."""
-        cache_key = f"{method}:{endpoint}:{params}:{json_data}"
-
-        if use_cache:
-            cached = await self.cache.get(cache_key)
-            if cached is not None:
-                return cached
-
-        url = f"{self.BASE_URL}{endpoint}"
-        headers = {}
-
-        if self.api_key:
-            headers["Authorization"] = f"Bearer {self.api_key}"
-
-        session = self._get_session()
-
-        try:
-            async with session.request(
-                method,
-                url,
-                params=params,
-                json=json_data,
-                headers=headers,
-            ) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    if use_cache:
-                        await self.cache.set(cache_key, data)
-                    return data
-                elif response.status == 404:
-                    logger.warning(f"ADJ API 404: {endpoint}")
-                    return None
-                else:
-                    text = await response.text()
-                    logger.error(f"ADJ API error {response.status}: {text[:200]}")
-                    raise Exception(f"ADJ API error {response.status}: {text[:200]}")
-        except asyncio.TimeoutError:
-            logger.error(f"ADJ API timeout for {endpoint}")
-            raise
-        except aiohttp.ClientError as e:
-            logger.error(f"ADJ API client error: {e}")
-            raise
+        """Make HTTP request with caching.
+
+        Concurrent cache misses for the same key share a single HTTP call.
+        ``rate_limiter`` overrides the client's own limiter for this call.
+        """
+        cache_key = self.cache.make_key(method, endpoint, params or {}, json_data or {})
+        if rate_limiter is None:
+            rate_limiter = self.rate_limiter
+
+        if not use_cache:
+            return await self._fetch(
+                method, endpoint, params, json_data, cache_key, rate_limiter
+            )
+
+        cached = await self.cache.get(cache_key)
+        if cached is _NOT_FOUND:
+            return None
+        if cached is not None:
+            return cached
+
+        task = self._inflight.get(cache_key)
+        if task is None:
+            # The fetch runs as its own task so that no single caller owns it
+            task = asyncio.ensure_future(
+                self._fetch(
+                    method,
+                    endpoint,
+                    params,
+                    json_data,
+                    cache_key,
+                    rate_limiter,
+                    use_cache=True,
+                )
+            )
+            self._inflight[cache_key] = task
+            task.add_done_callback(lambda done: self._fetch_done(cache_key, done))
+
+        # Shielded so cancelling one caller leaves the fetch running for the rest
+        return await asyncio.shield(task)
+
+    def _fetch_done(self, cache_key: int, task: asyncio.Task) -> None:
+        del self._inflight[cache_key]
+        # Callers re-raise any error themselves; retrieve it here so a fetch
+        # whose callers were all cancelled doesn't log it as unhandled.
+        if not task.cancelled():
+            task.exception()
+
+    async def _fetch(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[dict],
+        json_data: Optional[dict],
+        cache_key: int,
+        rate_limiter: Optional["LeakyBucketLimiter"],
+        use_cache: bool = False,
+    ) -> Any:
+        """Issue the HTTP request, caching the outcome if ``use_cache``."""
+        session = await self._get_session()
+
+        if rate_limiter is not None:
+            await rate_limiter.acquire()
+
+        async with self._semaphore:
+            try:
+                async with session.request(
+                    method,
+                    _endpoint_url(self.BASE_URL, endpoint),
+                    params=params,
+                    json=json_data,
+                    headers=self._default_headers,
+                    timeout=self.timeout,
+                ) as response:
+                    if response.status == 200:
+                        data = orjson.loads(await response.read())
+                        if use_cache:
+                            await self.cache.set(cache_key, data)
+                        return data
+                    elif response.status == 404:
+                        logger.warning("ADJ API 404: %s", endpoint)
+                        if use_cache:
+                            await self.cache.set(
+                                cache_key, _NOT_FOUND, ttl=self.not_found_ttl
+                            )
+                        return None
+                    else:
+                        text = await response.text()
+                        logger.error("ADJ API error %s: %.200s", response.status, text)
+                        raise Exception(
+                            f"ADJ API error {response.status}: {text[:200]}"
+                        )
+            except asyncio.TimeoutError:
+                logger.error("ADJ API timeout for %s", endpoint)
+                raise
+            except aiohttp.ClientError as e:
+                logger.error("ADJ API client error: %s", e)
+                raise
 
     # ==================== SEARCH ====================
 
@@ -161,6 +351,7 @@ class AdjClient:
         limit: int = 10,
         min_similarity: float = 0.0,
         max_similarity: float = 1.0,
+        rate_limiter: Optional["LeakyBucketLimiter"] = None,
     ) -> dict:
         """Unified semantic search across all entity types.
 
@@ -170,20 +361,24 @@ class AdjClient:
             limit: Max results (default 10)
             min_similarity: Minimum similarity threshold (0.0-1.0)
             max_similarity: Maximum similarity threshold (0.0-1.0)
+            rate_limiter: Outbound request limiter for this call
 
         Returns:
             SearchResult with matched entities
         """
-        params = {
-            "q": query,
-            "limit": limit,
-            "min_similarity": min_similarity,
-            "max_similarity": max_similarity,
-        }
+        # Omit bounds the server already defaults to, so equivalent searches
+        # share one URL and one cache key.
+        params = {"q": query, "limit": limit}
+        if min_similarity > 0.0:
+            params["min_similarity"] = min_similarity
+        if max_similarity < 1.0:
+            params["max_similarity"] = max_similarity
         if entity_type:
             params["type"] = entity_type
 
-        return await self._request("GET", "/search", params=params)
+        return await self._request(
+            "GET", "/search", params=params, rate_limiter=rate_limiter
+        )
 
     # ==================== MARKETS ====================
 
@@ -208,13 +403,20 @@ class AdjClient:
 
         return await self._request("GET", "/markets", params=params)
 
-    async def get_market(self, market_id: str) -> Optional[dict]:
+    async def get_market(
+        self,
+        market_id: str,
+        rate_limiter: Optional["LeakyBucketLimiter"] = None,
+    ) -> Optional[dict]:
         """Get market details by ID.
 
         Args:
             market_id: Market ticker or ID (e.g., "SENATECO-26-R")
+            rate_limiter: Outbound request limiter for this call
         """
-        return await self._request("GET", f"/markets/{market_id}")
+        return await self._request(
+            "GET", f"/markets/{market_id}", rate_limiter=rate_limiter
+        )
 
     async def get_market_prices(
         self,
@@ -361,13 +563,17 @@ class AdjClient:
     # ==================== CONVENIENCE METHODS ====================
 
     async def find_related_markets(
-        self, question: str, threshold: float = 0.5
+        self,
+        question: str,
+        threshold: float = 0.5,
+        rate_limiter: Optional["LeakyBucketLimiter"] = None,
     ) -> list[dict]:
         """Find markets related to a forecasting question.
 
         Args:
             question: The forecasting question text
             threshold: Minimum similarity to include (0.0-1.0)
+            rate_limiter: Outbound request limiter for this call
 
         Returns:
             List of related markets with similarity scores
@@ -377,6 +583,7 @@ class AdjClient:
             entity_type="market",
             limit=10,
             min_similarity=threshold,
+            rate_limiter=rate_limiter,
         )
 
         if result and "results" in result:
@@ -387,30 +594,41 @@ class AdjClient:
         self,
         question: str,
         direct_match_threshold: float = 0.7,
+        rate_limiter: Optional["LeakyBucketLimiter"] = None,
     ) -> tuple[Optional[float], str]:
         """Get prediction market prior for a question.
 
         Args:
             question: The forecasting question
             direct_match_threshold: Similarity threshold for "direct match"
+            rate_limiter: Outbound request limiter for this lookup
 
         Returns:
             Tuple of (prior_probability or None, formatted_section)
         """
-        results = await self.find_related_markets(question)
+        results = await self.find_related_markets(question, rate_limiter=rate_limiter)
 
         if not results:
             return None, ""
 
-        # Check for direct match
-        for match in results:
-            if match.get("similarity", 0) >= direct_match_threshold:
-                market_id = match.get("entity_id")
-                if market_id:
-                    market = await self.get_market(market_id)
-                    if market and market.get("probability") is not None:
-                        prob = market["probability"]
-                        section = f"""PREDICTION MARKET PRIOR (Direct Match):
+        # Check for direct match, taking the first (most similar) candidate
+        # that has a probability. Candidates are fetched a few at a time so a
+        # hit near the top doesn't spend rate-limiter slots on the rest.
+        direct = [
+            match
+            for match in results
+            if match.get("similarity", 0) >= direct_match_threshold
+            and match.get("entity_id")
+        ]
+        for start in range(0, len(direct), _DIRECT_MATCH_BATCH_SIZE):
+            batch = direct[start : start + _DIRECT_MATCH_BATCH_SIZE]
+            markets = await self._fetch_markets(
+                batch, _DIRECT_MATCH_FIELDS, rate_limiter
+            )
+            for match, market in zip(batch, markets):
+                if market and market.get("probability") is not None:
+                    prob = market["probability"]
+                    section = f"""PREDICTION MARKET PRIOR (Direct Match):
 Platform: {market.get("platform", "unknown")}
 Question: {market.get("question", "N/A")}
 Current Probability: {prob}%
@@ -418,33 +636,64 @@ Volume: ${market.get("volume", 0):,.0f}
 Similarity: {match.get("similarity", 0):.0%}
 
 This is a DIRECT MATCH. Use this as your primary anchor."""
-                        return prob / 100.0, section
+                    return prob / 100.0, section
 
         # No direct match, format similar markets
+        related = [match for match in results[:5] if match.get("entity_id")]
         section_lines = ["RELATED PREDICTION MARKETS (for reference):"]
-        for match in results[:5]:
-            market_id = match.get("entity_id")
-            if market_id:
-                market = await self.get_market(market_id)
-                if market:
-                    sim = match.get("similarity", 0)
+        markets = await self._fetch_markets(
+            related, _RELATED_MARKET_FIELDS, rate_limiter
+        )
+        for match, market in zip(related, markets):
+            if market:
+                sim = match.get("similarity", 0)
+                section_lines.append(
+                    f"- [{sim:.0%} similar] {market.get('question', 'N/A')}"
+                )
+                if market.get("probability") is not None:
                     section_lines.append(
-                        f"- [{sim:.0%} similar] {market.get('question', 'N/A')}"
+                        f"  {market.get('platform', 'unknown')}: {market['probability']}%"
                     )
-                    if market.get("probability") is not None:
-                        section_lines.append(
-                            f"  {market.get('platform', 'unknown')}: {market['probability']}%"
-                        )
 
         return None, "\n".join(section_lines)
 
+    async def _fetch_markets(
+        self,
+        matches: list[dict],
+        fields: tuple[str, ...],
+        rate_limiter: Optional["LeakyBucketLimiter"] = None,
+    ) -> list[Optional[dict]]:
+        """Get market details for search matches.
+
+        Matches that already carry every field in ``fields`` are used as-is;
+        the rest are fetched concurrently. A failed lookup yields None for
+        that match instead of failing the whole prior.
+        """
+        to_fetch = [match for match in matches if not all(f in match for f in fields)]
+        fetched = await asyncio.gather(
+            *(
+                self.get_market(match["entity_id"], rate_limiter=rate_limiter)
+                for match in to_fetch
+            ),
+            return_exceptions=True,
+        )
+        by_id = {
+            match["entity_id"]: None if isinstance(market, BaseException) else market
+            for match, market in zip(to_fetch, fetched)
+        }
+        return [by_id.get(match["entity_id"], match) for match in matches]
+
 
 # Singleton instance for easy access
 _adj_client: Optional[AdjClient] = None
 
 
 def get_adj_client() -> AdjClient:
-    """Get or create the global ADJ client instance."""
+    """Get or create the global ADJ client instance.
+
+    The client is shared by every bot, so it carries no rate limiter of its
+    own; callers pass theirs per request instead.
+    """
     global _adj_client
     if _adj_client is None:
         _adj_client = AdjClient()
@@ -8,10 +8,13 @@ Combines:
 
 import asyncio
 import logging
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
 
 from config import config
-from .adj_client import AdjClient, get_adj_client
+from .adj_client import AdjClient, get_adj_client, get_shared_session
+
+if TYPE_CHECKING:
+    from bot.rate_limit import LeakyBucketLimiter
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +23,7 @@ async def get_adj_prior_section(
     question: str,
     adj_client: Optional[AdjClient] = None,
     direct_match_threshold: float = 0.7,
+    rate_limiter: Optional["LeakyBucketLimiter"] = None,
 ) -> tuple[Optional[float], str]:
     """Get ADJ prediction market prior for a question.
 
@@ -27,6 +31,7 @@ async def get_adj_prior_section(
         question: The forecasting question text
         adj_client: ADJ client instance (uses global if None)
         direct_match_threshold: Similarity for "direct match"
+        rate_limiter: Outbound request limiter for this lookup
 
     Returns:
         Tuple of (prior_probability or None, formatted_section)
@@ -34,17 +39,30 @@ async def get_adj_prior_section(
     client = adj_client or get_adj_client()
 
     try:
-        return await client.get_market_prior(question, direct_match_threshold)
+        return await client.get_market_prior(
+            question, direct_match_threshold, rate_limiter=rate_limiter
+        )
     except Exception as e:
         logger.error(f"ADJ prior lookup failed: {e}")
         return None, ""
 
 
-async def get_asknews_summary(question: str) -> str:
+def _truncate(text: str, limit: int) -> str:
+    """Clip text to ``limit`` characters, marking the cut with an ellipsis."""
+    if len(text) > limit:
+        return text[:limit] + "..."
+    return text
+
+
+async def get_asknews_summary(
+    question: str,
+    rate_limiter: Optional["LeakyBucketLimiter"] = None,
+) -> str:
     """Get recent news summary from AskNews.
 
     Args:
         question: The forecasting question
+        rate_limiter: Outbound request limiter
 
     Returns:
         Formatted news summary or empty string on failure
@@ -62,6 +80,8 @@ async def get_asknews_summary(question: str) -> str:
             scopes={"news"},
         ) as ask:
             # Get recent news
+            if rate_limiter is not None:
+                await rate_limiter.acquire()
             hot_response = await ask.news.search_news(
                 query=question,
                 n_articles=5,
@@ -70,6 +90,8 @@ async def get_asknews_summary(question: str) -> str:
             )
 
             # Get historical context
+            if rate_limiter is not None:
+                await rate_limiter.acquire()
             historical_response = await ask.news.search_news(
                 query=question,
                 n_articles=8,
@@ -77,7 +99,7 @@ async def get_asknews_summary(question: str) -> str:
                 strategy="news knowledge",
             )
 
-            # Format results
+            # Format results: one entry per article, joined once at the end
             sections = []
 
             hot_articles = getattr(hot_response, "as_dicts", [])
@@ -95,14 +117,12 @@ async def get_asknews_summary(question: str) -> str:
                     source = getattr(article, "source_id", "")
                     url = getattr(article, "article_url", "")
 
-                    sections.append(f"**{title}** ({date_str})")
+                    entry = f"**{title}** ({date_str})\n"
                     if summary:
-                        sections.append(
-                            summary[:300] + ("..." if len(summary) > 300 else "")
-                        )
+                        entry += _truncate(summary, 300) + "\n"
                     if source and url:
-                        sections.append(f"Source: [{source}]({url})")
-                    sections.append("")
+                        entry += f"Source: [{source}]({url})\n"
+                    sections.append(entry)
 
             historical_articles = getattr(historical_response, "as_dicts", [])
             if historical_articles:
@@ -111,12 +131,10 @@ async def get_asknews_summary(question: str) -> str:
                     title = getattr(article, "eng_title", str(article))
                     summary = getattr(article, "summary", "")
 
-                    sections.append(f"**{title}**")
+                    entry = f"**{title}**\n"
                     if summary:
-                        sections.append(
-                            summary[:200] + ("..." if len(summary) > 200 else "")
-                        )
-                    sections.append("")
+                        entry += _truncate(summary, 200) + "\n"
+                    sections.append(entry)
 
             return "\n".join(sections)
 
@@ -125,11 +143,15 @@ async def get_asknews_summary(question: str) -> str:
         return ""
 
 
-async def get_perplexity_research(question: str) -> str:
+async def get_perplexity_research(
+    question: str,
+    rate_limiter: Optional["LeakyBucketLimiter"] = None,
+) -> str:
     """Get deep research from Perplexity.
 
     Args:
         question: The forecasting question
+        rate_limiter: Outbound request limiter
 
     Returns:
         Research summary with citations or empty string on failure
@@ -140,6 +162,7 @@ async def get_perplexity_research(question: str) -> str:
 
     try:
         import aiohttp
+        import orjson
 
         url = "https://api.perplexity.ai/chat/completions"
         headers = {
@@ -169,22 +192,23 @@ async def get_perplexity_research(question: str) -> str:
 
         timeout = aiohttp.ClientTimeout(total=60)
 
-        async with aiohttp.ClientSession(timeout=timeout) as session:
-            async with session.post(url, json=payload, headers=headers) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    content = (
-                        data.get("choices", [{}])[0]
-                        .get("message", {})
-                        .get("content", "")
-                    )
-                    return content
-                else:
-                    text = await response.text()
-                    logger.error(
-                        f"Perplexity API error {response.status}: {text[:200]}"
-                    )
-                    return ""
+        if rate_limiter is not None:
+            await rate_limiter.acquire()
+
+        session = await get_shared_session()
+        async with session.post(
+            url, json=payload, headers=headers, timeout=timeout
+        ) as response:
+            if response.status == 200:
+                data = orjson.loads(await response.read())
+                content = (
+                    data.get("choices", [{}])[0].get("message", {}).get("content", "")
+                )
+                return content
+            else:
+                text = await response.text()
+                logger.error(f"Perplexity API error {response.status}: {text[:200]}")
+                return ""
 
     except Exception as e:
         logger.error(f"Perplexity lookup failed: {e}")
@@ -196,6 +220,7 @@ async def integrated_research(
     adj_client: Optional[AdjClient] = None,
     include_asknews: bool = True,
     include_perplexity: bool = True,
+    rate_limiter: Optional["LeakyBucketLimiter"] = None,
 ) -> str:
     """Run integrated research from multiple sources.
 
@@ -209,45 +234,35 @@ async def integrated_research(
         adj_client: ADJ client instance
         include_asknews: Whether to include AskNews
         include_perplexity: Whether to include Perplexity
+        rate_limiter: Shared limiter applied before each outbound request
 
     Returns:
         Compiled research context string
     """
-    sections = []
-
-    # Always try ADJ first (most valuable for forecasting)
-    adj_prior, adj_section = await get_adj_prior_section(question, adj_client)
-    if adj_section:
-        sections.append(adj_section)
-
-    # Run AskNews and Perplexity in parallel
-    tasks = []
+    # ADJ and the enabled external sources share no data, so run them all
+    # in parallel. ADJ always goes first in the output (most valuable for
+    # forecasting).
+    tasks = [get_adj_prior_section(question, adj_client, rate_limiter=rate_limiter)]
+    sources = []  # (label, section header) per external task
     if include_asknews:
-        tasks.append(get_asknews_summary(question))
-    else:
-        tasks.append(asyncio.sleep(0))  # Placeholder
-
+        tasks.append(get_asknews_summary(question, rate_limiter))
+        sources.append(("AskNews", ""))
     if include_perplexity:
-        tasks.append(get_perplexity_research(question))
-    else:
-        tasks.append(asyncio.sleep(0))  # Placeholder
-
-    results = await asyncio.gather(*tasks, return_exceptions=True)
-
-    # Process AskNews result
-    if include_asknews and len(results) >= 1:
-        asknews_result = results[0]
-        if isinstance(asknews_result, str) and asknews_result:
-            sections.append(asknews_result)
-        elif isinstance(asknews_result, Exception):
-            logger.error(f"AskNews error: {asknews_result}")
-
-    # Process Perplexity result
-    if include_perplexity and len(results) >= 2:
-        perplexity_result = results[1]
-        if isinstance(perplexity_result, str) and perplexity_result:
-            sections.append("### Deep Research\n" + perplexity_result)
-        elif isinstance(perplexity_result, Exception):
-            logger.error(f"Perplexity error: {perplexity_result}")
+        tasks.append(get_perplexity_research(question, rate_limiter))
+        sources.append(("Perplexity", "### Deep Research\n"))
+
+    adj_result, *results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    sections = []
+    if isinstance(adj_result, Exception):
+        logger.error(f"ADJ error: {adj_result}")
+    elif adj_result[1]:
+        sections.append(adj_result[1])
+
+    for (label, header), result in zip(sources, results):
+        if isinstance(result, Exception):
+            logger.error(f"{label} error: {result}")
+        elif isinstance(result, str) and result:
+            sections.append(header + result)
 
     return "\n\n".join(sections)
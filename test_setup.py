@@ -108,6 +108,41 @@ async def test_adj_client():
     return True
 
 
+async def test_request_coalescing():
+    """Test that cancelling one coalesced ADJ request leaves the others running."""
+    print("\nTesting ADJ request coalescing...")
+    from research import AdjClient
+
+    client = AdjClient(persist_cache=False)
+    calls = []
+
+    async def fake_fetch(method, endpoint, *args, **kwargs):
+        calls.append(endpoint)
+        await asyncio.sleep(0.05)
+        return {"id": endpoint}
+
+    client._fetch = fake_fetch
+
+    leader = asyncio.create_task(client._request("GET", "/markets/x"))
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(client._request("GET", "/markets/x"))
+    await asyncio.sleep(0.01)
+    leader.cancel()
+
+    try:
+        result = await waiter
+    except asyncio.CancelledError:
+        print("  ✗ Waiter cancelled along with the first caller")
+        return False
+
+    if result != {"id": "/markets/x"} or calls != ["/markets/x"]:
+        print(f"  ✗ Expected one shared fetch, got {calls} -> {result}")
+        return False
+
+    print("  ✓ Concurrent requests share one fetch and survive cancellation")
+    return True
+
+
 def main():
     """Run all tests."""
     print("=" * 50)
@@ -120,6 +155,7 @@ def main():
     all_passed &= test_config()
     all_passed &= test_committee()
     all_passed &= asyncio.run(test_adj_client())
+    all_passed &= asyncio.run(test_request_coalescing())
 
     print("\n" + "=" * 50)
     if all_passed: